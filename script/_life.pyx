@@ -0,0 +1,38 @@
+# cython: language_level=3
+"""
+A compiled stepper for Conway's Game of Life, used by main.py as an alternative to Numba.
+
+Build it from the script directory with: python setup.py build_ext --inplace
+"""
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def step(unsigned char[:, ::1] grid, unsigned char[:, ::1] next_grid):
+    """
+    Computes the next generation of the Game of Life grid.
+
+    :param grid: UInt8[][] - The NumPy array that represents the current generation Game of Life grid
+    :param next_grid: UInt8[][] - The NumPy array that the next generation Game of Life grid is written into
+    """
+
+    cdef Py_ssize_t rows = grid.shape[0]
+    cdef Py_ssize_t cols = grid.shape[1]
+    cdef Py_ssize_t row, col, row_up, row_down, col_left, col_right
+    cdef int live_neighbors
+
+    for row in range(rows):
+        # The rows above and below wrap around the grid without using the (slow) modulo operator
+        row_up = rows - 1 if row == 0 else row - 1
+        row_down = 0 if row == rows - 1 else row + 1
+        for col in range(cols):
+            col_left = cols - 1 if col == 0 else col - 1
+            col_right = 0 if col == cols - 1 else col + 1
+
+            live_neighbors = (grid[row_up, col_left] + grid[row_up, col] + grid[row_up, col_right] +
+                              grid[row, col_left] + grid[row, col_right] +
+                              grid[row_down, col_left] + grid[row_down, col] + grid[row_down, col_right])
+
+            next_grid[row, col] = (live_neighbors == 3) | ((live_neighbors == 2) & (grid[row, col] == 1))
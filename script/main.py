@@ -1,25 +1,69 @@
 #!/usr/bin/env python3
 
 import time
+import argparse
+import functools
 import os
 import random
 import sys
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def clear_console():
+try:
+    from scipy import ndimage
+except ImportError:
+    ndimage = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    # The compiled stepper, which has to be built first with setup.py
+    import _life
+except ImportError:
+    _life = None
+
+
+if np is not None:
+    # Sums the eight cells surrounding a center cell plus 9 times the center cell itself, so that every state and number
+    # of live neighbors is encoded in one value: a dead cell sums to its live neighbors and a live cell to 9 + them
+    KERNEL = np.array([[1, 1, 1],
+                       [1, 9, 1],
+                       [1, 1, 1]], dtype=np.uint8)
+
+
+def enable_ansi_console():
     """
-    Clears the console using a system command based on the user's operating system.
+    Enables the processing of ANSI escape codes in the console on Windows. Linux and macOS terminals already support
+    them.
 
     """
 
     if sys.platform.startswith('win'):
-        os.system("cls")
-    elif sys.platform.startswith('linux'):
-        os.system("clear")
-    elif sys.platform.startswith('darwin'):
-        os.system("clear")
-    else:
-        print("Unable to clear terminal. Your operating system is not supported.\n\r")
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        # -11 is STD_OUTPUT_HANDLE and 0x0004 is ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+
+
+def clear_console():
+    """
+    Clears the console by moving the cursor to the top left corner and erasing the screen using ANSI escape codes,
+    rather than starting a new shell process to run a system command every time the console is cleared.
+
+    """
+
+    sys.stdout.write("\x1b[H\x1b[2J")
+    sys.stdout.flush()
 
 
 def resize_console(rows, cols):
@@ -48,24 +92,23 @@ def resize_console(rows, cols):
 
 def create_initial_grid(rows, cols):
     """
-    Creates a random list of lists that contains 1s and 0s to represent the cells in Conway's Game of Life.
+    Creates a random grid that contains 1s and 0s to represent the cells in Conway's Game of Life.
 
     :param rows: Int - The number of rows that the Game of Life grid will have
     :param cols: Int - The number of columns that the Game of Life grid will have
-    :return: Int[][] - A list of lists containing 1s for live cells and 0s for dead cells
+    :return: Int[][] - A list of bytearrays (or a NumPy array when NumPy is installed) containing 1s for live cells and
+    0s for dead cells
     """
 
-    grid = []
-    for row in range(rows):
-        grid_rows = []
-        for col in range(cols):
-            # Generate a random number and based on that decide whether to add a live or dead cell to the grid
-            if random.randint(0, 7) == 0:
-                grid_rows += [1]
-            else:
-                grid_rows += [0]
-        grid += [grid_rows]
-    return grid
+    # When NumPy is available the grid is stored as a single contiguous array of uint8 cells rather than a list of
+    # lists of Python ints, and every cell is generated at once with a 1 in 8 chance of being alive
+    if np is not None:
+        rng = np.random.default_rng()
+        return (rng.integers(0, 8, (rows, cols), dtype=np.uint8) == 0).astype(np.uint8)
+
+    # Generate a random number for each cell and based on that decide whether to make it a live or dead cell. Each row
+    # is a bytearray, which stores a cell in a single byte rather than as a Python int.
+    return [bytearray(1 if random.randrange(8) == 0 else 0 for col in range(cols)) for row in range(rows)]
 
 
 def print_grid(rows, cols, grid, generation):
@@ -74,27 +117,62 @@ def print_grid(rows, cols, grid, generation):
 
     :param rows: Int - The number of rows that the Game of Life grid has
     :param cols: Int - The number of columns that the Game of Life grid has
-    :param grid: Int[][] - The list of lists that will be used to represent the Game of Life grid
+    :param grid: Int[][] - The NumPy array or list of bytearrays that represents the Game of Life grid
     :param generation: Int - The current generation of the Game of Life grid
     """
 
     clear_console()
 
-    # A single output string is used to help reduce the flickering caused by printing multiple lines
-    output_str = ""
+    header = "Generation {0} - To exit the program press <Ctrl-C>\n\r".format(generation)
 
-    # Compile the output string together and then print it to console
-    output_str += "Generation {0} - To exit the program press <Ctrl-C>\n\r".format(generation)
-    for row in range(rows):
-        for col in range(cols):
-            if grid[row][col] == 0:
-                output_str += ". "
-            else:
-                output_str += "@ "
-        output_str += "\n\r"
+    # When NumPy is available the whole frame is built at once as an array of characters, one row of the grid per row
+    # of the array, and then written to the console as a single block of bytes
+    if np is not None:
+        frame = np.full((rows, cols * 2 + 2), ord(" "), dtype=np.uint8)
+        frame[:, :cols * 2:2] = np.where(grid == 0, ord("."), ord("@"))
+        frame[:, -2] = ord("\n")
+        frame[:, -1] = ord("\r")
+
+        sys.stdout.flush()
+        sys.stdout.buffer.write(header.encode() + frame.tobytes() + b" ")
+        sys.stdout.buffer.flush()
+        return
+
+    # A single output string is used to help reduce the flickering caused by printing multiple lines
+    output_str = header + "".join("".join(". " if cell == 0 else "@ " for cell in grid[row]) + "\n\r"
+                                  for row in range(rows))
     print(output_str, end=" ")
 
 
+def print_grid_changes(rows, cols, grid, shown_grid, generation):
+    """
+    Prints to console only the cells of the Game of Life grid that differ from the grid currently shown, by moving the
+    cursor to each of those cells and redrawing it, instead of redrawing the whole grid.
+
+    :param rows: Int - The number of rows that the Game of Life grid has
+    :param cols: Int - The number of columns that the Game of Life grid has
+    :param grid: Int[][] - The Game of Life grid to show
+    :param shown_grid: Int[][] - A copy of the Game of Life grid currently shown, which is updated to match grid
+    :param generation: Int - The current generation of the Game of Life grid
+    """
+
+    if np is not None:
+        changed = np.argwhere(grid != shown_grid).tolist()
+    else:
+        changed = [(row, col) for row in range(rows) for col in range(cols) if grid[row][col] != shown_grid[row][col]]
+
+    # Rewrite the generation count on the first line, then each changed cell, whose rows start below the first line
+    # and whose columns are two characters wide (counting from 1), and finally return the cursor below the grid
+    output = ["\x1b[HGeneration {0} - To exit the program press <Ctrl-C>".format(generation)]
+    for row, col in changed:
+        output += ["\x1b[{0};{1}H{2}".format(row + 2, col * 2 + 1, ". " if grid[row][col] == 0 else "@ ")]
+        shown_grid[row][col] = grid[row][col]
+    output += ["\x1b[{0};1H".format(rows + 2)]
+
+    sys.stdout.write("".join(output))
+    sys.stdout.flush()
+
+
 def create_next_grid(rows, cols, grid, next_grid):
     """
     Analyzes the current generation of the Game of Life grid and determines what cells live and die in the next
@@ -102,68 +180,502 @@ def create_next_grid(rows, cols, grid, next_grid):
 
     :param rows: Int - The number of rows that the Game of Life grid has
     :param cols: Int - The number of columns that the Game of Life grid has
-    :param grid: Int[][] - The list of lists that will be used to represent the current generation Game of Life grid
-    :param next_grid: Int[][] - The list of lists that will be used to represent the next generation of the Game of Life
+    :param grid: Int[][] - The NumPy array or list of bytearrays that represents the current generation Game of Life
     grid
+    :param next_grid: Int[][] - The NumPy array or list of bytearrays that the next generation Game of Life grid is
+    written into
     """
 
+    # Look up tables of the neighboring row and column indices, using the modulo operator (%) the grid wraps around
+    rows_up = [(row - 1) % rows for row in range(rows)]
+    rows_down = [(row + 1) % rows for row in range(rows)]
+    cols_left = [(col - 1) % cols for col in range(cols)]
+    cols_right = [(col + 1) % cols for col in range(cols)]
+
+    # Reading cells from lists is faster than from NumPy arrays or bytearrays, so copy the rows into lists once for the
+    # whole grid
+    cells = grid.tolist() if np is not None else [list(grid_row) for grid_row in grid]
+
     for row in range(rows):
+        above = cells[rows_up[row]]
+        center = cells[row]
+        below = cells[rows_down[row]]
+        next_row = next_grid[row]
         for col in range(cols):
+            left = cols_left[col]
+            right = cols_right[col]
+
             # Get the number of live cells adjacent to the cell at grid[row][col]
-            live_neighbors = get_live_neighbors(row, col, rows, cols, grid)
+            live_neighbors = (above[left] + above[col] + above[right] +
+                              center[left] + center[right] +
+                              below[left] + below[col] + below[right])
 
-            # If the number of surrounding live cells is < 2 or > 3 then we make the cell at grid[row][col] a dead cell
-            if live_neighbors < 2 or live_neighbors > 3:
-                next_grid[row][col] = 0
-            # If the number of surrounding live cells is 3 and the cell at grid[row][col] was previously dead then make
-            # the cell into a live cell
-            elif live_neighbors == 3 and grid[row][col] == 0:
-                next_grid[row][col] = 1
-            # If the number of surrounding live cells is 3 and the cell at grid[row][col] is alive keep it alive
-            else:
-                next_grid[row][col] = grid[row][col]
+            # A cell is alive in the next generation if it has exactly 3 live neighbors, or if it is already alive and
+            # has exactly 2 live neighbors. Every other cell dies from underpopulation or overpopulation.
+            next_row[col] = (live_neighbors == 3) | ((live_neighbors == 2) & center[col])
 
 
-def get_live_neighbors(row, col, rows, cols, grid):
+def _step_active(rows, cols, grid, next_grid, active):
     """
-    Counts the number of live cells surrounding a center cell at grid[row][cell].
+    Computes the next generation of the Game of Life grid for only the active cells, the cells with a neighbor (or
+    themselves) that changed in the last generation. Every other cell keeps its state, which the next generation grid
+    already holds as it was the grid of the generation before. The active cells for the generation after are the
+    cells that change now along with their neighbors.
 
-    :param row: Int - The row of the center cell
-    :param col: Int - The column of the center cell
     :param rows: Int - The number of rows that the Game of Life grid has
     :param cols: Int - The number of columns that the Game of Life grid has
-    :param grid: Int[][] - The list of lists that will be used to represent the Game of Life grid
-    :return: Int - The number of live cells surrounding the cell at grid[row][cell]
+    :param grid: Int[][] - The current generation Game of Life grid
+    :param next_grid: Int[][] - The grid of the previous generation, which the next generation is written into
+    :param active: Set - The (row, col) tuples of the active cells, which are replaced with the active cells for the
+    generation after
+    """
+
+    # Reading single cells from a NumPy array is slow, so read them from a copy of the grid as lists instead
+    if np is not None:
+        grid = grid.tolist()
+
+    changed = []
+    for row, col in active:
+        row_up = (row - 1) % rows
+        row_down = (row + 1) % rows
+        col_left = (col - 1) % cols
+        col_right = (col + 1) % cols
+
+        live_neighbors = (grid[row_up][col_left] + grid[row_up][col] + grid[row_up][col_right] +
+                          grid[row][col_left] + grid[row][col_right] +
+                          grid[row_down][col_left] + grid[row_down][col] + grid[row_down][col_right])
+
+        alive = 1 if live_neighbors == 3 or (live_neighbors == 2 and grid[row][col] == 1) else 0
+        next_grid[row][col] = alive
+        if alive != grid[row][col]:
+            changed += [(row, col)]
+
+    active.clear()
+    for row, col in changed:
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                active.add(((row + i) % rows, (col + j) % cols))
+
+
+def _step_convolve(grid, next_grid, counts, born, survive):
+    """
+    Computes the next generation of the Game of Life grid by encoding every cell's state and number of live neighbors
+    with a single convolution, using the 'wrap' mode so that the grid wraps around, and then applying the ruleset to the
+    whole grid at once.
+
+    :param grid: UInt8[][] - The NumPy array that represents the current generation Game of Life grid
+    :param next_grid: UInt8[][] - The NumPy array that the next generation Game of Life grid is written into
+    :param counts: UInt8[][] - A NumPy array the size of the grid that the encoded cells are written into
+    :param born: Bool[][] - A NumPy array the size of the grid used as scratch space for the cells that are born
+    :param survive: Bool[][] - A NumPy array the size of the grid used as scratch space for the cells that survive
+    """
+
+    ndimage.convolve(grid, KERNEL, output=counts, mode='wrap')
+
+    # A dead cell with 3 live neighbors (3) is born, and a live cell with 2 or 3 live neighbors (11 or 12) stays alive.
+    # Every operation writes into a preallocated array so that no temporary arrays are created.
+    np.equal(counts, 3, out=born)
+    np.equal(counts, 11, out=survive)
+    np.logical_or(born, survive, out=born)
+    np.equal(counts, 12, out=survive)
+    np.logical_or(born, survive, out=next_grid)
+
+
+def _step_roll(grid, next_grid, live_neighbors, born, survive):
+    """
+    Computes the next generation of the Game of Life grid by adding together the eight copies of the grid that are
+    shifted by one cell in each direction. np.roll wraps the shifted cells around to the other side of the grid.
+
+    :param grid: UInt8[][] - The NumPy array that represents the current generation Game of Life grid
+    :param next_grid: UInt8[][] - The NumPy array that the next generation Game of Life grid is written into
+    :param live_neighbors: UInt8[][] - A NumPy array the size of the grid that the neighbor counts are added up in
+    :param born: Bool[][] - A NumPy array the size of the grid used as scratch space for the cells that are born
+    :param survive: Bool[][] - A NumPy array the size of the grid used as scratch space for the cells that survive
+    """
+
+    live_neighbors.fill(0)
+    for row_shift in (-1, 0, 1):
+        for col_shift in (-1, 0, 1):
+            if not (row_shift == 0 and col_shift == 0):
+                np.add(live_neighbors, np.roll(grid, (row_shift, col_shift), (0, 1)), out=live_neighbors)
+
+    # A cell is alive in the next generation if it has exactly 3 live neighbors, or if it is already alive and has
+    # exactly 2 live neighbors. Each of these operations writes into a preallocated array, so applying the ruleset
+    # creates no temporary arrays (np.roll above still creates a shifted copy of the grid for each neighbor).
+    np.equal(live_neighbors, 3, out=born)
+    np.equal(live_neighbors, 2, out=survive)
+    np.logical_and(survive, grid, out=survive)
+    np.logical_or(born, survive, out=next_grid)
+
+
+def _step_tiled(rows, grid, next_grid, tile):
     """
+    Computes the next generation of the Game of Life grid in strips of rows, so that each strip and the rows around it
+    stay in the CPU cache while its neighbors are added up. In each strip the cells are first added to their left and
+    right neighbors, and then those sums are added to the sums of the rows above and below.
+
+    :param rows: Int - The number of rows that the Game of Life grid has
+    :param grid: UInt8[][] - The NumPy array that represents the current generation Game of Life grid
+    :param next_grid: UInt8[][] - The NumPy array that the next generation Game of Life grid is written into
+    :param tile: Int - The number of rows in each strip
+    """
+
+    for top in range(0, rows, tile):
+        bottom = min(top + tile, rows)
 
-    life_sum = 0
-    for i in range(-1, 2):
-        for j in range(-1, 2):
-            # Make sure to count the center cell located at grid[row][col]
-            if not (i == 0 and j == 0):
-                # Using the modulo operator (%) the grid wraps around
-                life_sum += grid[((row + i) % rows)][((col + j) % cols)]
-    return life_sum
+        # The strip along with the row above and below it, which wrap around the grid
+        strip = grid.take(range(top - 1, bottom + 1), axis=0, mode='wrap')
+        row_sums = strip + np.roll(strip, 1, axis=1) + np.roll(strip, -1, axis=1)
 
+        # Remove each cell from its own count, leaving only the live neighbors
+        center = strip[1:-1]
+        live_neighbors = row_sums[:-2] + row_sums[1:-1] + row_sums[2:] - center
+        next_grid[top:bottom] = (live_neighbors == 3) | ((live_neighbors == 2) & center)
 
-def grid_changing(rows, cols, grid, next_grid):
+
+@functools.lru_cache(maxsize=None)
+def _compile_step(rows, cols):
     """
-    Checks to see if the current generation Game of Life grid is the same as the next generation Game of Life grid.
+    Compiles with Numba a function that computes the next generation of a Game of Life grid of the given size, using
+    plain loops over contiguous uint8 arrays. The number of rows and columns are constants inside the compiled code, so
+    Numba can fold the loop bounds and wrap-around checks into the machine code. The compiled function is cached for
+    each grid size, so running the game again with the same size does not compile it again.
 
     :param rows: Int - The number of rows that the Game of Life grid has
     :param cols: Int - The number of columns that the Game of Life grid has
-    :param grid: Int[][] - The list of lists that will be used to represent the current generation Game of Life grid
-    :param next_grid: Int[][] - The list of lists that will be used to represent the next generation of the Game of Life
-    grid
-    :return: Boolean - Whether the current generation grid is the same as the next generation grid
+    :return: Function - The compiled function, which takes the current generation grid and writes the next generation
+    into the next generation grid
+    """
+
+    def step(grid, next_grid):
+        for row in range(rows):
+            # The rows above and below wrap around the grid without using the (slow) modulo operator
+            row_up = rows - 1 if row == 0 else row - 1
+            row_down = 0 if row == rows - 1 else row + 1
+            for col in range(cols):
+                col_left = cols - 1 if col == 0 else col - 1
+                col_right = 0 if col == cols - 1 else col + 1
+
+                live_neighbors = (grid[row_up, col_left] + grid[row_up, col] + grid[row_up, col_right] +
+                                  grid[row, col_left] + grid[row, col_right] +
+                                  grid[row_down, col_left] + grid[row_down, col] + grid[row_down, col_right])
+
+                next_grid[row, col] = (live_neighbors == 3) | ((live_neighbors == 2) & (grid[row, col] == 1))
+
+    # Giving the signature compiles the function right away, rather than on its first call inside the game loop
+    return numba.njit("void(uint8[:, ::1], uint8[:, ::1])", boundscheck=False)(step)
+
+
+def _pack_bitboard(grid, words):
+    """
+    Packs each row of the Game of Life grid into 64 bit words, storing the cell at grid[row][col] in bit col % 64 of
+    word col // 64 of the row. Any unused bits at the end of the last word of each row are left as 0s.
+
+    :param grid: UInt8[][] - The NumPy array that represents the Game of Life grid
+    :param words: Int - The number of 64 bit words needed to hold one row of the Game of Life grid
+    :return: UInt64[][] - The NumPy array containing the packed rows of the Game of Life grid
+    """
+
+    packed = np.zeros((grid.shape[0], words * 8), dtype=np.uint8)
+    row_bytes = np.packbits(grid, axis=1, bitorder='little')
+    packed[:, :row_bytes.shape[1]] = row_bytes
+    return packed.view('<u8')
+
+
+def _step_bitboard(rows, cols, grid, next_grid):
     """
+    Computes the next generation of the Game of Life grid on bitboards. The live neighbors of 64 cells are counted at
+    once by adding the eight shifted neighbor boards together into three bit-planes with bitwise half adders.
+
+    :param rows: Int - The number of rows that the Game of Life grid has
+    :param cols: Int - The number of columns that the Game of Life grid has
+    :param grid: UInt8[][] - The NumPy array that represents the current generation Game of Life grid
+    :param next_grid: UInt8[][] - The NumPy array that the next generation Game of Life grid is written into
+    """
+
+    one = np.uint64(1)
+    top_bit = np.uint64(63)
+    last_bit = np.uint64((cols - 1) % 64)
+    board = _pack_bitboard(grid, (cols + 63) // 64)
+
+    # Shift every row one cell to the right so that each bit holds its left neighbor. Bits carry over between words and
+    # the last cell of the row wraps around into the first bit, while the bit pushed past the last cell is cleared.
+    left = board << one
+    left[:, 1:] |= board[:, :-1] >> top_bit
+    left[:, 0] |= (board[:, -1] >> last_bit) & one
+    left[:, -1] &= np.uint64(0xFFFFFFFFFFFFFFFF) >> (top_bit - last_bit)
+
+    # Shift every row one cell to the left so that each bit holds its right neighbor, wrapping the first cell of the row
+    # around into the bit of the last cell
+    right = board >> one
+    right[:, :-1] |= board[:, 1:] << top_bit
+    right[:, -1] |= (board[:, 0] & one) << last_bit
+
+    # Add the eight neighbor boards together, the rows above and below wrap around through np.roll. The count of each
+    # cell is held in the bit-planes ones, twos and fours, where fours is kept set for any count of 4 or more.
+    ones = np.zeros_like(board)
+    twos = np.zeros_like(board)
+    fours = np.zeros_like(board)
+    for neighbors in (np.roll(left, 1, axis=0), np.roll(board, 1, axis=0), np.roll(right, 1, axis=0),
+                      left, right,
+                      np.roll(left, -1, axis=0), np.roll(board, -1, axis=0), np.roll(right, -1, axis=0)):
+        carry = ones & neighbors
+        ones ^= neighbors
+        fours |= twos & carry
+        twos ^= carry
+
+    # A cell lives on a count of 2 or 3 (twos set and fours clear), as long as it is either alive or the count is 3
+    board = twos & ~fours & (ones | board)
+    next_grid[:] = np.unpackbits(board.view(np.uint8), axis=1, count=cols, bitorder='little')
+
+
+class _Node(object):
+    """
+    A square node of a HashLife quadtree with 2^level cells on each side. Nodes are only ever created through _join,
+    which hands back the cached node for the same four children, so two nodes holding the same cells are usually the
+    same object and can be hashed and compared by identity. A node that has been evicted from the cache is rebuilt as
+    a new object, which only costs a miss in the cache of _next_generation.
+
+    """
+
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+# The two single cell nodes that every other node is built from
+_DEAD = _Node(None, None, None, None, 0, 0)
+_ALIVE = _Node(None, None, None, None, 0, 1)
+
+# The number of nodes (and of stepped results) that HashLife keeps cached
+_HASHLIFE_CACHE_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=_HASHLIFE_CACHE_SIZE)
+def _join(nw, ne, sw, se):
+    """
+    Gets the node made up of the four given quadrants, each of which is a node one level lower.
+
+    :param nw: _Node - The north west (top left) quadrant
+    :param ne: _Node - The north east (top right) quadrant
+    :param sw: _Node - The south west (bottom left) quadrant
+    :param se: _Node - The south east (bottom right) quadrant
+    :return: _Node - The node one level higher than the quadrants
+    """
+
+    return _Node(nw, ne, sw, se, nw.level + 1, nw.population + ne.population + sw.population + se.population)
+
+
+@functools.lru_cache(maxsize=None)
+def _empty_node(level):
+    """
+    Gets the node of the given level that contains only dead cells.
+
+    :param level: Int - The level of the node
+    :return: _Node - The empty node
+    """
+
+    if level == 0:
+        return _DEAD
+    child = _empty_node(level - 1)
+    return _join(child, child, child, child)
+
+
+def _step_4x4(node):
+    """
+    Computes the next generation of the center 2x2 cells of a 4x4 node directly from the ruleset.
+
+    :param node: _Node - The level 2 node
+    :return: _Node - The level 1 node holding the next generation of the center cells
+    """
+
+    cells = [[node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+             [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+             [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+             [node.sw.sw, node.sw.se, node.se.sw, node.se.se]]
+
+    center = []
+    for row in (1, 2):
+        for col in (1, 2):
+            live_neighbors = sum(cells[row + i][col + j].population
+                                 for i in range(-1, 2) for j in range(-1, 2) if not (i == 0 and j == 0))
+            alive = live_neighbors == 3 or (live_neighbors == 2 and cells[row][col].population == 1)
+            center += [_ALIVE if alive else _DEAD]
+    return _join(*center)
+
+
+@functools.lru_cache(maxsize=_HASHLIFE_CACHE_SIZE)
+def _next_generation(node):
+    """
+    Computes the next generation of the center of a node, the square half as wide as the node. The center is split into
+    four quarters, each of which is the center of a node one level lower made up from nine overlapping sub-nodes, so
+    the work recurses down to 4x4 nodes. Results are cached, so any region of the grid that has been seen before is
+    not computed again.
+
+    :param node: _Node - The node to step, of level 2 or higher
+    :return: _Node - The node one level lower holding the next generation of the center of the node
+    """
+
+    if node.population == 0:
+        return _empty_node(node.level - 1)
+    if node.level == 2:
+        return _step_4x4(node)
+
+    nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+    n00 = _join(nw.nw.se, nw.ne.sw, nw.sw.ne, nw.se.nw)
+    n01 = _join(nw.ne.se, ne.nw.sw, nw.se.ne, ne.sw.nw)
+    n02 = _join(ne.nw.se, ne.ne.sw, ne.sw.ne, ne.se.nw)
+    n10 = _join(nw.sw.se, nw.se.sw, sw.nw.ne, sw.ne.nw)
+    n11 = _join(nw.se.se, ne.sw.sw, sw.ne.ne, se.nw.nw)
+    n12 = _join(ne.sw.se, ne.se.sw, se.nw.ne, se.ne.nw)
+    n20 = _join(sw.nw.se, sw.ne.sw, sw.sw.ne, sw.se.nw)
+    n21 = _join(sw.ne.se, se.nw.sw, sw.se.ne, se.sw.nw)
+    n22 = _join(se.nw.se, se.ne.sw, se.sw.ne, se.se.nw)
+
+    return _join(_next_generation(_join(n00, n01, n10, n11)), _next_generation(_join(n01, n02, n11, n12)),
+                 _next_generation(_join(n10, n11, n20, n21)), _next_generation(_join(n11, n12, n21, n22)))
+
+
+def _write_node(node, grid, top, left, rows, cols):
+    """
+    Sets the cells of the Game of Life grid that are alive in a node, skipping any part of the node that is empty or
+    that lies outside of the grid.
+
+    :param node: _Node - The node to write into the grid
+    :param grid: Int[][] - The Game of Life grid, with every cell already set to 0
+    :param top: Int - The row of the grid that the top of the node is placed at
+    :param left: Int - The column of the grid that the left of the node is placed at
+    :param rows: Int - The number of rows that the Game of Life grid has
+    :param cols: Int - The number of columns that the Game of Life grid has
+    """
+
+    if node.population == 0 or top >= rows or left >= cols:
+        return
+    if node.level == 0:
+        grid[top][left] = 1
+        return
+
+    half = 1 << (node.level - 1)
+    _write_node(node.nw, grid, top, left, rows, cols)
+    _write_node(node.ne, grid, top, left + half, rows, cols)
+    _write_node(node.sw, grid, top + half, left, rows, cols)
+    _write_node(node.se, grid, top + half, left + half, rows, cols)
+
+
+def _step_hashlife(rows, cols, grid, next_grid, level):
+    """
+    Computes the next generation of the Game of Life grid with HashLife. Since the grid wraps around, it is tiled into
+    a square window twice as wide as the grid so that the center of the window is the grid itself, with enough of the
+    wrapped around cells surrounding it. The window is rebuilt as a quadtree every generation, and the cached results
+    of _next_generation are reused for every region of it that has been seen before.
+
+    :param rows: Int - The number of rows that the Game of Life grid has
+    :param cols: Int - The number of columns that the Game of Life grid has
+    :param grid: Int[][] - The current generation Game of Life grid
+    :param next_grid: Int[][] - The grid that the next generation Game of Life grid is written into
+    :param level: Int - The level of the window, which must be large enough for its center to hold the whole grid
+    """
+
+    if np is not None:
+        grid = grid.tolist()
+
+    # The window starts a quarter of its size before the grid, and each of its cells is read from the wrapped around
+    # position in the grid
+    size = 1 << level
+    offset = size // 4
+    window_cols = [(col - offset) % cols for col in range(size)]
+    window = []
+    for row in range(size):
+        grid_row = grid[(row - offset) % rows]
+        window += [[_ALIVE if grid_row[col] else _DEAD for col in window_cols]]
+
+    # Join every 2x2 block of nodes into the node one level higher until only the root node is left
+    while len(window) > 1:
+        window = [[_join(window[row][col], window[row][col + 1], window[row + 1][col], window[row + 1][col + 1])
+                   for col in range(0, len(window), 2)]
+                  for row in range(0, len(window), 2)]
 
     for row in range(rows):
-        for col in range(cols):
-            # If the cell at grid[row][col] is not equal to next_grid[row][col]
-            if not grid[row][col] == next_grid[row][col]:
-                return True
-    return False
+        next_grid[row][:] = [0] * cols
+    _write_node(_next_generation(window[0][0]), next_grid, 0, 0, rows, cols)
+
+
+def get_steppers():
+    """
+    Gets the names of the steppers, the methods of computing the next generation of the Game of Life grid, that can be
+    used with the modules that are installed.
+
+    :return: String[] - The names of the usable steppers, ordered from fastest to slowest
+    """
+
+    steppers = []
+    if numba is not None:
+        steppers += ["numba"]
+    if _life is not None and np is not None:
+        steppers += ["cython"]
+    if np is not None:
+        steppers += ["tiled", "roll", "bitboard"]
+    if ndimage is not None:
+        steppers += ["convolve"]
+    steppers += ["active", "python", "hashlife"]
+    return steppers
+
+
+def create_stepper(name, rows, cols):
+    """
+    Creates the function that computes the next generation of the Game of Life grid using the given stepper. Any
+    buffers that the stepper needs are allocated here once, rather than on every generation.
+
+    :param name: String - The name of the stepper to use, or "auto" to use the fastest stepper that is installed
+    :param rows: Int - The number of rows that the Game of Life grid has
+    :param cols: Int - The number of columns that the Game of Life grid has
+    :return: Function - A function that takes the current generation grid and writes the next generation into the
+    next generation grid
+    """
+
+    if name == "auto":
+        name = get_steppers()[0]
+
+    if name == "numba":
+        return _compile_step(rows, cols)
+    elif name == "cython":
+        return _life.step
+    elif name == "convolve":
+        counts = np.empty((rows, cols), dtype=np.uint8)
+        born = np.empty((rows, cols), dtype=bool)
+        survive = np.empty((rows, cols), dtype=bool)
+        return lambda grid, next_grid: _step_convolve(grid, next_grid, counts, born, survive)
+    elif name == "tiled":
+        # Keep the three copies of each strip (the strip, and it shifted left and right) inside a 32 KiB L1 cache
+        tile = max(1, 32 * 1024 // (3 * cols) - 2)
+        return lambda grid, next_grid: _step_tiled(rows, grid, next_grid, tile)
+    elif name == "bitboard":
+        return lambda grid, next_grid: _step_bitboard(rows, cols, grid, next_grid)
+    elif name == "roll":
+        live_neighbors = np.empty((rows, cols), dtype=np.uint8)
+        born = np.empty((rows, cols), dtype=bool)
+        survive = np.empty((rows, cols), dtype=bool)
+        return lambda grid, next_grid: _step_roll(grid, next_grid, live_neighbors, born, survive)
+    elif name == "active":
+        # Every cell is active in the first generation
+        active = set((row, col) for row in range(rows) for col in range(cols))
+        return lambda grid, next_grid: _step_active(rows, cols, grid, next_grid, active)
+    elif name == "hashlife":
+        # Start each run with empty caches, so the nodes of an earlier run are not kept in memory
+        _join.cache_clear()
+        _next_generation.cache_clear()
+
+        # The center of the window, half as wide as the window, has to hold the whole grid
+        level = max(3, (max(rows, cols) - 1).bit_length() + 1)
+        return lambda grid, next_grid: _step_hashlife(rows, cols, grid, next_grid, level)
+    else:
+        return lambda grid, next_grid: create_next_grid(rows, cols, grid, next_grid)
 
 
 def get_integer_value(prompt, low, high):
@@ -189,10 +701,11 @@ def get_integer_value(prompt, low, high):
     return value
 
 
-def run_game():
+def run_game(stepper):
     """
     Asks the user for input to setup the Game of Life to run for a given number of generations.
 
+    :param stepper: String - The name of the stepper used to compute each generation, or "auto"
     """
 
     clear_console()
@@ -210,14 +723,40 @@ def run_game():
     current_generation = create_initial_grid(rows, cols)
     next_generation = create_initial_grid(rows, cols)
 
+    step = create_stepper(stepper, rows, cols)
+
     # Run Game of Life sequence
+    shown_grid = None
+    deadline = time.monotonic()
     gen = 1
     for gen in range(1, generations + 1):
-        if not grid_changing(rows, cols, current_generation, next_generation):
+        step(current_generation, next_generation)
+
+        # Stop once the next generation is the same as the current generation, as the grid has reached a static state
+        if np is not None:
+            static = np.array_equal(current_generation, next_generation)
+        else:
+            static = current_generation == next_generation
+        if static:
             break
-        print_grid(rows, cols, current_generation, gen)
-        create_next_grid(rows, cols, current_generation, next_generation)
-        time.sleep(1 / 5.0)
+
+        # Draw the whole grid on the first generation, and after that only the cells that changed
+        if shown_grid is None:
+            print_grid(rows, cols, current_generation, gen)
+            shown_grid = current_generation.copy() if np is not None else [row[:] for row in current_generation]
+        else:
+            print_grid_changes(rows, cols, current_generation, shown_grid, gen)
+
+        # Wait until the next frame is due, 5 frames per second, so the time spent computing and drawing the grid is
+        # part of the frame rather than being added on top of it
+        deadline += 1 / 5.0
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            # The frame ran late (or the console was paused), so start counting again from now rather than rushing
+            # through the following frames to catch up
+            deadline = time.monotonic()
         current_generation, next_generation = next_generation, current_generation
 
     print_grid(rows, cols, current_generation, gen)
@@ -225,8 +764,14 @@ def run_game():
 
 
 # Start the Game of Life
+parser = argparse.ArgumentParser(description="Conway's Game of Life")
+parser.add_argument("--stepper", choices=["auto"] + get_steppers(), default="auto",
+                    help="the method used to compute each generation (default: the fastest one installed)")
+args = parser.parse_args()
+
+enable_ansi_console()
 run = "r"
 while run == "r":
-    out = run_game()
+    out = run_game(args.stepper)
     run = out
 
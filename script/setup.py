@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+
+# Builds the optional compiled stepper (_life.pyx) next to main.py. Run from the script directory with:
+#     python setup.py build_ext --inplace
+
+import sys
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+if sys.platform.startswith('win'):
+    compile_args = ["/O2"]
+else:
+    compile_args = ["-O3", "-march=native"]
+
+setup(
+    name="life",
+    ext_modules=cythonize([Extension("_life", ["_life.pyx"], extra_compile_args=compile_args)]),
+)